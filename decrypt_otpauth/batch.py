@@ -0,0 +1,58 @@
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from decrypt_otpauth.otpauth.types_ import Folder
+
+FileWorker = Callable[[str, str], dict[str, Folder]]
+
+
+@dataclass
+class FileResult:
+    """Outcome of processing a single file of a batch"""
+
+    path: str
+    folders: dict[str, Folder] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_batch(
+    worker: FileWorker,
+    paths: Sequence[str],
+    password: str,
+    workers: int | None = None,
+) -> list[FileResult]:
+    """Run `worker` on every path, in parallel when several files are given.
+
+    A failing file is reported in its FileResult and never stops the others.
+
+    Args:
+        worker: Module-level (picklable) callable processing one file
+        paths: Files to process
+        password: Password shared by all files
+        workers: Number of worker processes, defaults to the number of CPUs
+
+    Returns:
+        One FileResult per path, in the same order as `paths`
+    """
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return [_run_one(worker, path, password) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_one, worker, path, password) for path in paths]
+        return [future.result() for future in futures]
+
+
+def _run_one(worker: FileWorker, path: str, password: str) -> FileResult:
+    # exceptions are flattened to text: they are not always picklable across
+    # process boundaries and the caller only reports them
+    try:
+        return FileResult(path, folders=worker(path, password))
+    except Exception as e:
+        return FileResult(path, error=str(e))
@@ -1,3 +1,27 @@
+import glob
+import os
+
+OTPAUTH_EXTENSION = ".otpauthdb"
+
+
 def read_file(filename: str) -> bytes:
     with open(filename, "rb") as f:
         return f.read()
+
+
+def expand_paths(path: str) -> list[str]:
+    """Expand a file, directory or glob pattern into a sorted list of files.
+
+    Args:
+        path: A single file, a directory containing .otpauthdb files or a glob
+            pattern (e.g. "backups/**/*.otpauthdb")
+
+    Returns:
+        The matching file paths, sorted for a deterministic processing order
+    """
+    if os.path.isdir(path):
+        pattern = os.path.join(glob.escape(path), f"*{OTPAUTH_EXTENSION}")
+        return sorted(glob.glob(pattern))
+    if glob.has_magic(path):
+        return sorted(p for p in glob.glob(path, recursive=True) if os.path.isfile(p))
+    return [path]
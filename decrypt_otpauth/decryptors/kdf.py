@@ -0,0 +1,109 @@
+import functools
+import hashlib
+import time
+from typing import Protocol
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+
+class KDFBackend(Protocol):
+    name: str
+
+    @classmethod
+    def pbkdf2(
+        cls,
+        password_bytes: bytes,
+        salt: bytes,
+        iterations: int,
+        length: int,
+        hash_name: str = "sha1",
+    ) -> bytes:
+        """Derive a key with PBKDF2-HMAC.
+
+        Args:
+            password_bytes: The encoded password
+            salt: The salt
+            iterations: Number of PBKDF2 iterations
+            length: Length of the derived key in bytes
+            hash_name: Name of the HMAC hash function
+
+        Returns:
+            The derived key
+        """
+
+
+class HashlibKDF(KDFBackend):
+    """PBKDF2 from the standard library (releases the GIL while deriving)"""
+
+    name = "hashlib"
+
+    @classmethod
+    def pbkdf2(
+        cls,
+        password_bytes: bytes,
+        salt: bytes,
+        iterations: int,
+        length: int,
+        hash_name: str = "sha1",
+    ) -> bytes:
+        return hashlib.pbkdf2_hmac(hash_name, password_bytes, salt, iterations, length)
+
+
+class CryptographyKDF(KDFBackend):
+    """PBKDF2 from the cryptography package"""
+
+    name = "cryptography"
+
+    __ALGORITHMS = {
+        "sha1": hashes.SHA1,
+        "sha256": hashes.SHA256,
+        "sha512": hashes.SHA512,
+    }
+
+    @classmethod
+    def pbkdf2(
+        cls,
+        password_bytes: bytes,
+        salt: bytes,
+        iterations: int,
+        length: int,
+        hash_name: str = "sha1",
+    ) -> bytes:
+        kdf = PBKDF2HMAC(
+            algorithm=cls.__ALGORITHMS[hash_name](),
+            length=length,
+            salt=bytes(salt),
+            iterations=iterations,
+        )
+        return kdf.derive(bytes(password_bytes))
+
+
+KDF_BACKENDS: dict[str, type[KDFBackend]] = {
+    HashlibKDF.name: HashlibKDF,
+    CryptographyKDF.name: CryptographyKDF,
+}
+
+
+def get_kdf_backend(name: str) -> type[KDFBackend]:
+    """Get a KDF backend by name, "auto" selecting the fastest one on this host"""
+    if name == "auto":
+        return fastest_kdf_backend()
+    if (backend := KDF_BACKENDS.get(name)) is None:
+        msg = f"Unknown KDF backend: {name} (expected one of {', '.join(KDF_BACKENDS)})"
+        raise ValueError(msg)
+    return backend
+
+
+@functools.cache
+def fastest_kdf_backend(iterations: int = 2000, rounds: int = 3) -> type[KDFBackend]:
+    """Benchmark every backend once per process and return the fastest one"""
+    timings = {}
+    for backend in KDF_BACKENDS.values():
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            backend.pbkdf2(b"benchmark", bytes(8), iterations, 32)
+            best = min(best, time.perf_counter() - start)
+        timings[backend] = best
+    return min(timings, key=timings.get)
@@ -0,0 +1,128 @@
+import hashlib
+import hmac
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a DerivedKeyCache"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DerivedKeyCache:
+    """Thread-safe bounded LRU cache of password-derived keys.
+
+    Entries are keyed by the salt and an HMAC of the password under a random
+    per-instance key, so the plaintext password is never stored. A `maxsize`
+    of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 0:
+            msg = "maxsize must be a positive integer or 0"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[bytes, bytes], bytes] = OrderedDict()
+        self._digest_key = os.urandom(32)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_derive(
+        self, password_bytes: bytes, salt: bytes, derive: Callable[[], bytes]
+    ) -> bytes:
+        """Return the cached key for (password, salt) or derive and cache it.
+
+        Args:
+            password_bytes: The encoded password
+            salt: The salt used by the derivation
+            derive: Callable computing the key on a cache miss
+
+        Returns:
+            The derived key
+        """
+        entry_key = self._entry_key(password_bytes, salt)
+        with self._lock:
+            if (derived := self._entries.get(entry_key)) is not None:
+                self._entries.move_to_end(entry_key)
+                self._hits += 1
+                return derived
+            self._misses += 1
+
+        # derived outside the lock so concurrent misses do not serialize
+        derived = derive()
+        self._store(entry_key, derived)
+        return derived
+
+    def get(self, password_bytes: bytes, salt: bytes) -> bytes | None:
+        """Return the cached key for (password, salt), if any"""
+        entry_key = self._entry_key(password_bytes, salt)
+        with self._lock:
+            if (derived := self._entries.get(entry_key)) is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(entry_key)
+            self._hits += 1
+            return derived
+
+    def put(self, password_bytes: bytes, salt: bytes, derived: bytes) -> None:
+        """Cache a key derived from (password, salt)"""
+        self._store(self._entry_key(password_bytes, salt), derived)
+
+    def evict(self, password_bytes: bytes, salt: bytes) -> bool:
+        """Remove the key derived from (password, salt).
+
+        Returns:
+            True if an entry was removed
+        """
+        entry_key = self._entry_key(password_bytes, salt)
+        with self._lock:
+            return self._entries.pop(entry_key, None) is not None
+
+    def clear(self) -> None:
+        """Remove every cached key and reset the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting the least recently used keys if needed"""
+        if maxsize < 0:
+            msg = "maxsize must be a positive integer or 0"
+            raise ValueError(msg)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict_overflow()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, entry_key: tuple[bytes, bytes], derived: bytes) -> None:
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._entries[entry_key] = derived
+            self._entries.move_to_end(entry_key)
+            self._evict_overflow()
+
+    def _evict_overflow(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def _entry_key(self, password_bytes: bytes, salt: bytes) -> tuple[bytes, bytes]:
+        password_digest = hmac.digest(self._digest_key, password_bytes, hashlib.sha256)
+        return bytes(salt), password_digest
@@ -1,9 +1,17 @@
 import hashlib
 import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from decrypt_otpauth.decryptors.decrypt import decrypt_aes_cbc
 from decrypt_otpauth.decryptors.decryptor import Decryptor
+from decrypt_otpauth.decryptors.kdf import (
+    KDFBackend,
+    fastest_kdf_backend,
+    get_kdf_backend,
+)
+from decrypt_otpauth.decryptors.key_cache import DerivedKeyCache
 
 
 @dataclass
@@ -58,21 +66,68 @@ class RNCryptorDecryptor(Decryptor):
     KEY_SIZE = 32
     PBKDF2_ITERATIONS = 10000
 
+    # shared by every call in the process; see DerivedKeyCache.cache_info()
+    key_cache = DerivedKeyCache()
+    # None selects the fastest backend on this host (see fastest_kdf_backend)
+    kdf_backend: type[KDFBackend] | None = None
+    # derive the HMAC and encryption keys in parallel threads
+    concurrent_derivation = True
+
+    __executor: ThreadPoolExecutor | None = None
+
     @classmethod
     def decrypt(cls, data: bytes, password: str) -> bytes:
         """Main decryption method"""
         password_bytes = password.encode("utf-8")
 
         components = RNCryptorComponents.from_bytes(data)
-        cls._check_hmac(components, password_bytes)
+        hmac_key, encryption_key = cls._derive_keys(components, password_bytes)
+        cls._check_hmac(components, password_bytes, hmac_key)
 
-        encryption_key = cls._derive_key(password_bytes, components.encryption_salt)
         return decrypt_aes_cbc(components.ciphertext, encryption_key, components.iv)
 
+    @classmethod
+    def use_kdf_backend(cls, name: str) -> None:
+        """Select the PBKDF2 backend: "hashlib", "cryptography" or "auto\""""
+        cls.kdf_backend = get_kdf_backend(name)
+
+    @classmethod
+    def _derive_keys(
+        cls, components: RNCryptorComponents, password_bytes: bytes
+    ) -> tuple[bytes, bytes]:
+        """Derive the (HMAC key, encryption key) pair"""
+        if not cls.concurrent_derivation:
+            return (
+                cls._derive_key(password_bytes, components.hmac_salt),
+                cls._derive_key(password_bytes, components.encryption_salt),
+            )
+
+        # the KDF releases the GIL: the encryption key is derived in a worker
+        # thread while the calling thread derives the HMAC key
+        encryption_key = cls._get_executor().submit(
+            cls._derive_key, password_bytes, components.encryption_salt
+        )
+        hmac_key = cls._derive_key(password_bytes, components.hmac_salt)
+        return hmac_key, encryption_key.result()
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if RNCryptorDecryptor.__executor is None:
+            RNCryptorDecryptor.__executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="rncryptor-kdf"
+            )
+        return RNCryptorDecryptor.__executor
+
     @classmethod
     def _derive_key(cls, password_bytes: bytes, salt: bytes) -> bytes:
-        return hashlib.pbkdf2_hmac(
-            "sha1",
+        return cls.key_cache.get_or_derive(
+            password_bytes, salt, lambda: cls._pbkdf2(password_bytes, salt)
+        )
+
+    @classmethod
+    def _pbkdf2(cls, password_bytes: bytes, salt: bytes) -> bytes:
+        backend = cls.kdf_backend or fastest_kdf_backend()
+        return backend.pbkdf2(
             password_bytes,
             salt,
             cls.PBKDF2_ITERATIONS,
@@ -81,14 +136,21 @@ class RNCryptorDecryptor(Decryptor):
 
     @classmethod
     def _check_hmac(
-        cls, components: RNCryptorComponents, password_bytes: bytes
+        cls,
+        components: RNCryptorComponents,
+        password_bytes: bytes,
+        hmac_key: bytes | None = None,
     ) -> None:
-        hmac_key = cls._derive_key(password_bytes, components.hmac_salt)
+        if hmac_key is None:
+            hmac_key = cls._derive_key(password_bytes, components.hmac_salt)
         expected_hmac = hmac.new(
             hmac_key, components.header_and_ciphertext, hashlib.sha256
         ).digest()
 
         if hmac.compare_digest(components.hmac_value, expected_hmac):
             return
+        # keys derived from a wrong password are never useful again
+        cls.key_cache.evict(password_bytes, components.hmac_salt)
+        cls.key_cache.evict(password_bytes, components.encryption_salt)
         msg = "HMAC verification failed - wrong password or corrupted data"
         raise ValueError(msg)
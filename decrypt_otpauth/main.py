@@ -1,6 +1,9 @@
 import getpass
+from collections.abc import Sequence
 from typing import Any
 
+from decrypt_otpauth.batch import FileResult, run_batch
+from decrypt_otpauth.core.file import expand_paths
 from decrypt_otpauth.decryptors.rncryptor_decryptor import RNCryptorDecryptor
 from decrypt_otpauth.ns_keyed_unarchiver.unarchiver import NSKeyedUnarchiver
 from decrypt_otpauth.otpauth.file import read_otpauth
@@ -26,6 +29,10 @@ class OTPAuthProcessor:
     def _get_password(file_path: str) -> str:
         return getpass.getpass(f"Password for export file {file_path}: ")
 
+    @staticmethod
+    def _get_batch_password(file_count: int) -> str:
+        return getpass.getpass(f"Password for {file_count} export files: ")
+
     @staticmethod
     def _decrypt_data(unarchived_data: dict[str, Any], password: str) -> bytes:
         return RNCryptorDecryptor.decrypt(unarchived_data["WrappedData"], password)
@@ -81,26 +88,93 @@ class OTPAuthProcessor:
         with open(output_path, "w", encoding="utf-8") as f:
             f.write("\n".join(lines) + "\n")
 
-    def process_file(self, file_path: str) -> dict[str, Folder]:
-        """Complete processing pipeline for an OTPAuth file."""
+    def process_file(
+        self, file_path: str, password: str | None = None
+    ) -> dict[str, Folder]:
+        """Complete processing pipeline for an OTPAuth file.
+
+        Args:
+            file_path: Path of the .otpauthdb file.
+            password: Backup password, prompted for when not provided.
+        """
         unarchived = self._load_and_unarchive(file_path)
-        password = self._get_password(file_path)
+        if password is None:
+            password = self._get_password(file_path)
         decrypted_data = self._decrypt_data(unarchived, password)
         final_data = self._unarchive_decrypted_data(decrypted_data)
         return self._build_folder_structure(final_data)
 
+    def process_files(
+        self, file_paths: Sequence[str], workers: int | None = None
+    ) -> list[FileResult]:
+        """Process several OTPAuth files in parallel with a single password prompt.
+
+        Args:
+            file_paths: Paths of the .otpauthdb files.
+            workers: Number of worker processes, defaults to the number of CPUs.
+
+        Returns:
+            One FileResult per file; a failing file does not stop the others.
+        """
+        password = self._get_batch_password(len(file_paths))
+        return run_batch(_process_file_worker, file_paths, password, workers)
+
+
+def _process_file_worker(file_path: str, password: str) -> dict[str, Folder]:
+    return OTPAuthProcessor().process_file(file_path, password)
+
+
+def _output_folders(
+    processor: OTPAuthProcessor, folders: dict[str, Folder], args
+) -> None:
+    if args.export_uris is not None:
+        processor.export_uris(folders, args.export_uris)
+    else:
+        processor.display_all_accounts(folders, args.images_location)
+
+
+def _run_batch(processor: OTPAuthProcessor, paths: list[str], args) -> int:
+    results = processor.process_files(paths, args.workers)
+    failures = [result for result in results if not result.ok]
+    for result in failures:
+        print(f"Error processing file {result.path}: {result.error}")
+
+    if args.export_uris is not None:
+        # a single export file gathers the accounts of every backup
+        folders = {
+            f"{result.path}:{name}": folder
+            for result in results
+            if result.ok
+            for name, folder in result.folders.items()
+        }
+        processor.export_uris(folders, args.export_uris)
+    else:
+        for result in results:
+            if not result.ok:
+                continue
+            if args.images_location is None:
+                print(f"\nFile '{result.path}'")
+            processor.display_all_accounts(result.folders, args.images_location)
+
+    print(f"Processed {len(results) - len(failures)}/{len(results)} files")
+    return 1 if failures else 0
+
 
 def main() -> None:
     """Main entry point for the OTPAuth decryption tool."""
     args = parse_args()
     processor = OTPAuthProcessor()
 
+    paths = expand_paths(args.path)
+    if not paths:
+        print(f"No backup file found for {args.path}")
+        return 1
+
     try:
-        folders = processor.process_file(args.path)
-        if args.export_uris is not None:
-            processor.export_uris(folders, args.export_uris)
-        else:
-            processor.display_all_accounts(folders, args.images_location)
+        if len(paths) > 1:
+            return _run_batch(processor, paths, args)
+        folders = processor.process_file(paths[0])
+        _output_folders(processor, folders, args)
     except Exception as e:
         print(f"Error processing file: {e}")
         return 1
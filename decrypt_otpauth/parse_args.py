@@ -9,7 +9,8 @@ def parse_args() -> argparse.Namespace:
         action="store",
         type=str,
         required=True,
-        help="path to your encrypted OTP Auth backup (.otpauthdb)",
+        help="path to your encrypted OTP Auth backup (.otpauthdb), a directory of "
+        "backups or a glob pattern",
     )
     parser.add_argument(
         "--images-location",
@@ -26,4 +27,12 @@ def parse_args() -> argparse.Namespace:
         metavar="FILE",
         help="export all otpauth:// URIs as plain text to FILE (one per line)",
     )
+    parser.add_argument(
+        "--workers",
+        action="store",
+        type=int,
+        required=False,
+        help="number of worker processes used when several backups are given "
+        "(defaults to the number of CPUs)",
+    )
     return parser.parse_args()
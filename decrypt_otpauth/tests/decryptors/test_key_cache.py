@@ -0,0 +1,82 @@
+import pathlib
+from unittest import mock
+
+import pytest
+
+from decrypt_otpauth.decryptors.key_cache import CacheInfo, DerivedKeyCache
+from decrypt_otpauth.decryptors.rncryptor_decryptor import RNCryptorDecryptor
+from decrypt_otpauth.ns_keyed_unarchiver.unarchiver import NSKeyedUnarchiver
+from decrypt_otpauth.otpauth.file import read_otpauth
+
+
+@pytest.fixture
+def wrapped_data() -> bytes:
+    path = pathlib.Path(__file__).parents[1] / "data" / "Accounts.otpauthdb"
+    return NSKeyedUnarchiver(read_otpauth(str(path))).unarchive()["WrappedData"]
+
+
+def test_get_or_derive_counts_hits_and_misses():
+    cache = DerivedKeyCache(maxsize=2)
+    derive = mock.Mock(return_value=b"key")
+
+    assert cache.get_or_derive(b"password", b"salt", derive) == b"key"
+    assert cache.get_or_derive(b"password", b"salt", derive) == b"key"
+
+    assert derive.call_count == 1
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+def test_lru_eviction():
+    cache = DerivedKeyCache(maxsize=2)
+    cache.put(b"password", b"salt-1", b"key-1")
+    cache.put(b"password", b"salt-2", b"key-2")
+    cache.get(b"password", b"salt-1")
+    cache.put(b"password", b"salt-3", b"key-3")
+
+    assert cache.get(b"password", b"salt-2") is None
+    assert cache.get(b"password", b"salt-1") == b"key-1"
+    assert cache.get(b"password", b"salt-3") == b"key-3"
+
+
+def test_explicit_eviction_and_clear():
+    cache = DerivedKeyCache()
+    cache.put(b"password", b"salt", b"key")
+
+    assert cache.evict(b"password", b"salt")
+    assert not cache.evict(b"password", b"salt")
+
+    cache.put(b"password", b"salt", b"key")
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+
+
+def test_password_is_not_stored_in_plaintext():
+    cache = DerivedKeyCache()
+    cache.put(b"my secret password", b"salt", b"key")
+
+    assert all(
+        b"my secret password" not in part for part in cache._entries.popitem()[0]
+    )
+
+
+def test_disabled_cache():
+    cache = DerivedKeyCache(maxsize=0)
+    cache.put(b"password", b"salt", b"key")
+    assert len(cache) == 0
+
+
+def test_decryptor_reuses_derived_keys(wrapped_data: bytes):
+    RNCryptorDecryptor.key_cache.clear()
+    first = RNCryptorDecryptor.decrypt(wrapped_data, "hello")
+    second = RNCryptorDecryptor.decrypt(wrapped_data, "hello")
+
+    assert first == second
+    info = RNCryptorDecryptor.key_cache.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_decryptor_evicts_wrong_password_keys(wrapped_data: bytes):
+    RNCryptorDecryptor.key_cache.clear()
+    with pytest.raises(ValueError):
+        RNCryptorDecryptor.decrypt(wrapped_data, "wrong")
+    assert len(RNCryptorDecryptor.key_cache) == 0
@@ -1,4 +1,5 @@
 import pathlib
+import shutil
 import tempfile
 from unittest import mock
 from typing import Annotated
@@ -7,6 +8,7 @@ from urllib.parse import urlparse, parse_qs
 import pytest
 import cv2
 
+from decrypt_otpauth.core.file import expand_paths
 from decrypt_otpauth.main import OTPAuthProcessor, main
 
 
@@ -113,3 +115,56 @@ def test_qr_codes_are_valid_and_decodable(
             assert params["secret"][0] in ["HELLO", "OKOA"]
             assert params["issuer"][0] == "TestService"
             assert params["period"][0] == "30"
+
+
+@pytest.fixture
+def backups_dir(
+    test_file_path: Annotated[pathlib.Path, pytest.fixture],
+):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in ("first.otpauthdb", "second.otpauthdb"):
+            shutil.copy(test_file_path, pathlib.Path(tmpdir) / name)
+        (pathlib.Path(tmpdir) / "broken.otpauthdb").write_bytes(b"not a backup")
+        yield pathlib.Path(tmpdir)
+
+
+def test_process_files_aggregates_results_and_errors(
+    backups_dir: Annotated[pathlib.Path, pytest.fixture],
+    test_password: Annotated[str, pytest.fixture],
+):
+    processor = OTPAuthProcessor()
+    paths = expand_paths(str(backups_dir))
+    with mock.patch("getpass.getpass", return_value=test_password) as getpass_mock:
+        results = processor.process_files(paths, workers=2)
+
+    assert getpass_mock.call_count == 1
+    assert [pathlib.Path(result.path).name for result in results] == [
+        "broken.otpauthdb",
+        "first.otpauthdb",
+        "second.otpauthdb",
+    ]
+    assert not results[0].ok
+    assert all(result.ok and result.folders for result in results[1:])
+
+
+def test_main_batch_export_uris(
+    backups_dir: Annotated[pathlib.Path, pytest.fixture],
+    test_password: Annotated[str, pytest.fixture],
+):
+    expected_uris = pathlib.Path(__file__).parent / "data" / "expected_uris.txt"
+    output_file = backups_dir / "uris.txt"
+    argv = [
+        "main.py",
+        "-p",
+        str(backups_dir / "[fs]*.otpauthdb"),
+        "--export-uris",
+        str(output_file),
+    ]
+    with mock.patch("sys.argv", argv):
+        with mock.patch("getpass.getpass", return_value=test_password):
+            result = main()
+
+    assert result == 0
+    assert output_file.read_text(encoding="utf-8") == 2 * expected_uris.read_text(
+        encoding="utf-8"
+    )